@@ -161,15 +161,17 @@ describe('skills.docGen', () => {
     }
   };
 
+  const createTemplateRuntime = (): McpRuntime => ({
+    invokeTool: vi.fn(async () => ({ success: true } as McpToolResult)),
+    queryPostgres: async () => templateResult
+  });
+
   it('rejects payloads that violate the candidate profile schema', async () => {
     await expect(skills.docGen({})).rejects.toThrow(/doc-gen input validation failed/i);
   });
 
   it('returns a schema-compliant offer', async () => {
-    const runtime: McpRuntime = {
-      invokeTool: vi.fn(async () => ({ success: true } as McpToolResult)),
-      queryPostgres: async () => templateResult
-    };
+    const runtime = createTemplateRuntime();
 
     const result = await skills.docGen(
       {
@@ -189,10 +191,7 @@ describe('skills.docGen', () => {
   });
 
   it('falls back to populated title/seniority when role/level are blank', async () => {
-    const runtime: McpRuntime = {
-      invokeTool: vi.fn(async () => ({ success: true } as McpToolResult)),
-      queryPostgres: async () => templateResult
-    };
+    const runtime = createTemplateRuntime();
 
     const result = await skills.docGen(
       {
@@ -212,10 +211,7 @@ describe('skills.docGen', () => {
   });
 
   it('emits warning when salary band payload is empty', async () => {
-    const runtime: McpRuntime = {
-      invokeTool: vi.fn(async () => ({ success: true } as McpToolResult)),
-      queryPostgres: async () => templateResult
-    };
+    const runtime = createTemplateRuntime();
 
     const result = await skills.docGen(
       {
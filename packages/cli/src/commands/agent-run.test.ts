@@ -29,6 +29,15 @@ const createStubRunner = (events: RunnerEvent[]): Runner => ({
   }
 });
 
+const stubDefaultRegistry = (events: RunnerEvent[]) => {
+  const registry = new InMemoryRunnerRegistry();
+  registry.register({
+    id: 'codex-cli',
+    create: () => createStubRunner(events)
+  });
+  return vi.spyOn(registryModule, 'getDefaultRunnerRegistry').mockReturnValue(registry);
+};
+
 describe('parseAgentRun', () => {
   it('produces a run spec with defaults applied', async () => {
     const parsed = await parseAgentRun(['Hello, world!']);
@@ -60,24 +69,15 @@ describe('parseAgentRun', () => {
 
 describe('agentRunHandler', () => {
   it('streams runner events to the provided streams', async () => {
-    const registry = new InMemoryRunnerRegistry();
-    registry.register({
-      id: 'codex-cli',
-      create: () =>
-        createStubRunner([
-          { type: 'log', data: 'starting' },
-          { type: 'message', role: 'assistant', content: 'hello' },
-          {
-            type: 'diff',
-            files: [{ path: 'README.md', patch: '+ hello world' }]
-          },
-          { type: 'done', sessionId: 'abc' }
-        ])
-    });
-
-    const registrySpy = vi
-      .spyOn(registryModule, 'getDefaultRunnerRegistry')
-      .mockReturnValue(registry);
+    const registrySpy = stubDefaultRegistry([
+      { type: 'log', data: 'starting' },
+      { type: 'message', role: 'assistant', content: 'hello' },
+      {
+        type: 'diff',
+        files: [{ path: 'README.md', patch: '+ hello world' }]
+      },
+      { type: 'done', sessionId: 'abc' }
+    ]);
 
     const stdout = collectStream();
     const stderr = collectStream();
@@ -98,19 +98,10 @@ describe('agentRunHandler', () => {
   });
 
   it('returns non-zero exit code when runner emits error', async () => {
-    const registry = new InMemoryRunnerRegistry();
-    registry.register({
-      id: 'codex-cli',
-      create: () =>
-        createStubRunner([
-          { type: 'error', error: { message: 'boom' } },
-          { type: 'done' }
-        ])
-    });
-
-    const registrySpy = vi
-      .spyOn(registryModule, 'getDefaultRunnerRegistry')
-      .mockReturnValue(registry);
+    const registrySpy = stubDefaultRegistry([
+      { type: 'error', error: { message: 'boom' } },
+      { type: 'done' }
+    ]);
 
     const stdout = collectStream();
     const stderr = collectStream();
@@ -128,36 +119,27 @@ describe('agentRunHandler', () => {
   });
 
   it('prints flow summary events to stdout', async () => {
-    const registry = new InMemoryRunnerRegistry();
-    registry.register({
-      id: 'codex-cli',
-      create: () =>
-        createStubRunner([
-          {
-            type: 'flow-summary',
-            summary: {
-              runs: 4,
-              successes: 3,
-              success_rate: 0.75,
-              avg_latency_ms: 1500,
-              errors: { total: 1, by_type: { timeout: 1 } },
-              mcp: {
-                calls: 2,
-                errors: 0,
-                tokens: { input: 10, output: 20, total: 30 },
-                cost_usd: 0.5
-              },
-              steps: [],
-              models: []
-            }
+    const registrySpy = stubDefaultRegistry([
+      {
+        type: 'flow-summary',
+        summary: {
+          runs: 4,
+          successes: 3,
+          success_rate: 0.75,
+          avg_latency_ms: 1500,
+          errors: { total: 1, by_type: { timeout: 1 } },
+          mcp: {
+            calls: 2,
+            errors: 0,
+            tokens: { input: 10, output: 20, total: 30 },
+            cost_usd: 0.5
           },
-          { type: 'done' }
-        ])
-    });
-
-    const registrySpy = vi
-      .spyOn(registryModule, 'getDefaultRunnerRegistry')
-      .mockReturnValue(registry);
+          steps: [],
+          models: []
+        }
+      },
+      { type: 'done' }
+    ]);
 
     const stdout = collectStream();
     const stderr = collectStream();
@@ -1,5 +1,7 @@
 import { describe, expect, test, vi } from 'vitest';
 import { parseMcpDoctor, mcpDoctorHandler } from './mcp-doctor.js';
+import { loadMcpServerDefinitions, type McpServerDefinition } from '../mcp/config.js';
+import { probeServer } from '../mcp/client.js';
 
 vi.mock('../mcp/config.js', () => ({
   loadMcpServerDefinitions: vi.fn(async () => [
@@ -43,6 +45,37 @@ vi.mock('../mcp/client.js', () => ({
   })
 }));
 
+const makeServer = (id: string, type: 'http' | 'stdio' = 'http'): McpServerDefinition => ({
+  id,
+  filePath: `tools/adk/servers/${id}.yaml`,
+  transports: [
+    type === 'stdio'
+      ? { type, label: `STDIO ${id}`, config: { type, command: id } }
+      : { type, label: `HTTP http://${id}`, config: { type, url: `http://${id}` } }
+  ]
+});
+
+const createStreams = () => {
+  let stdout = '';
+  let stderr = '';
+  return {
+    streams: {
+      stdout: {
+        write: (chunk: string) => {
+          stdout += chunk;
+        }
+      } as unknown as NodeJS.WritableStream,
+      stderr: {
+        write: (chunk: string) => {
+          stderr += chunk;
+        }
+      } as unknown as NodeJS.WritableStream
+    },
+    stdout: () => stdout,
+    stderr: () => stderr
+  };
+};
+
 describe('parseMcpDoctor', () => {
   test('parses defaults', async () => {
     const parsed = await parseMcpDoctor([]);
@@ -77,4 +110,98 @@ describe('parseMcpDoctor', () => {
     expect(stdout).toContain("Server 'demo': REACHABLE via STDIO demo");
     expect(stdout).toContain('HTTP http://primary: unreachable');
   });
+
+  test('probes servers concurrently and reports in preset order', async () => {
+    vi.mocked(loadMcpServerDefinitions).mockResolvedValueOnce([
+      makeServer('alpha'),
+      makeServer('beta')
+    ]);
+
+    const started: string[] = [];
+    let releaseAlpha: (() => void) | undefined;
+    const alphaGate = new Promise<void>((resolve) => {
+      releaseAlpha = resolve;
+    });
+    const gatedProbe = async (server: McpServerDefinition) => {
+      started.push(server.id);
+      if (server.id === 'alpha') {
+        await alphaGate;
+      }
+      return [{ server, transport: server.transports[0], status: 'reachable' as const }];
+    };
+    vi.mocked(probeServer).mockImplementationOnce(gatedProbe).mockImplementationOnce(gatedProbe);
+
+    const output = createStreams();
+    const pending = mcpDoctorHandler({ kind: 'mcp:doctor', json: true }, output.streams);
+
+    await vi.waitFor(() => expect(started).toEqual(['alpha', 'beta']));
+    releaseAlpha?.();
+
+    expect(await pending).toBe(0);
+    const parsed = JSON.parse(output.stdout()) as Array<{ serverId: string }>;
+    expect(parsed.map((entry) => entry.serverId)).toEqual(['alpha', 'beta']);
+  });
+
+  test('reports the first failing probe in preset order', async () => {
+    vi.mocked(loadMcpServerDefinitions).mockResolvedValueOnce([
+      makeServer('alpha'),
+      makeServer('beta'),
+      makeServer('gamma')
+    ]);
+
+    const probe = async (server: McpServerDefinition) => {
+      if (server.id === 'beta') {
+        await new Promise((resolve) => setTimeout(resolve, 10));
+        throw new Error('beta exploded');
+      }
+      if (server.id === 'gamma') {
+        throw new Error('gamma exploded');
+      }
+      return [{ server, transport: server.transports[0], status: 'reachable' as const }];
+    };
+    vi.mocked(probeServer)
+      .mockImplementationOnce(probe)
+      .mockImplementationOnce(probe)
+      .mockImplementationOnce(probe);
+
+    const output = createStreams();
+    const exitCode = await mcpDoctorHandler({ kind: 'mcp:doctor', json: false }, output.streams);
+
+    expect(exitCode).toBe(1);
+    expect(output.stdout()).toContain("Server 'alpha': REACHABLE");
+    expect(output.stderr()).toContain('beta exploded');
+    expect(output.stderr()).not.toContain('gamma exploded');
+  });
+
+  test('runs STDIO probes one at a time', async () => {
+    vi.mocked(loadMcpServerDefinitions).mockResolvedValueOnce([
+      makeServer('first', 'stdio'),
+      makeServer('second', 'stdio')
+    ]);
+
+    const started: string[] = [];
+    let releaseFirst: (() => void) | undefined;
+    const firstGate = new Promise<void>((resolve) => {
+      releaseFirst = resolve;
+    });
+    const gatedProbe = async (server: McpServerDefinition) => {
+      started.push(server.id);
+      if (server.id === 'first') {
+        await firstGate;
+      }
+      return [{ server, transport: server.transports[0], status: 'reachable' as const }];
+    };
+    vi.mocked(probeServer).mockImplementationOnce(gatedProbe).mockImplementationOnce(gatedProbe);
+
+    const output = createStreams();
+    const pending = mcpDoctorHandler({ kind: 'mcp:doctor', json: false }, output.streams);
+
+    await vi.waitFor(() => expect(started).toEqual(['first']));
+    await new Promise((resolve) => setTimeout(resolve, 10));
+    expect(started).toEqual(['first']);
+    releaseFirst?.();
+
+    expect(await pending).toBe(0);
+    expect(started).toEqual(['first', 'second']);
+  });
 });
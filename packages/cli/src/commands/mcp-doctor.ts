@@ -1,5 +1,5 @@
 import { Args, Flags, Parser } from '@oclif/core';
-import { loadMcpServerDefinitions } from '../mcp/config.js';
+import { loadMcpServerDefinitions, type McpServerDefinition } from '../mcp/config.js';
 import { probeServer } from '../mcp/client.js';
 import type { CliStreams } from '../utils/streams.js';
 import { writeLine } from '../utils/streams.js';
@@ -42,10 +42,12 @@ export const parseMcpDoctor = async (argv: string[]): Promise<ParsedMcpDoctor> =
   };
 };
 
+type ProbeSummary = Awaited<ReturnType<typeof probeServer>>;
+
 const summarizeProbe = (
   streams: CliStreams,
   options: { json: boolean },
-  summary: Awaited<ReturnType<typeof probeServer>>
+  summary: ProbeSummary
 ) => {
   if (options.json) {
     const normalized = summary.map((entry) => ({
@@ -88,6 +90,42 @@ const summarizeProbe = (
   });
 };
 
+type ProbeOutcome = { ok: true; value: ProbeSummary } | { ok: false; error: unknown };
+
+const describeError = (error: unknown): string =>
+  error instanceof Error ? error.message : typeof error === 'string' ? error : 'Unknown error';
+
+const usesStdio = (server: McpServerDefinition): boolean =>
+  server.transports.some((transport) => transport.type === 'stdio');
+
+// Start every probe up front so network round-trips overlap, but run servers with a
+// STDIO transport one at a time: they inherit stderr, and concurrent `npx` installs
+// would interleave their output. Results are consumed in preset order and the first
+// failure ends the run, so queued STDIO probes after a known failure are skipped.
+const startProbes = (targets: McpServerDefinition[]): Promise<ProbeOutcome>[] => {
+  let firstFailure = Number.POSITIVE_INFINITY;
+  let stdioQueue: Promise<unknown> = Promise.resolve();
+  return targets.map((server, index) => {
+    const run = (): Promise<ProbeOutcome> =>
+      probeServer(server).then(
+        (value): ProbeOutcome => ({ ok: true, value }),
+        (error: unknown): ProbeOutcome => {
+          firstFailure = Math.min(firstFailure, index);
+          return { ok: false, error };
+        }
+      );
+    if (!usesStdio(server)) {
+      return run();
+    }
+    const outcome = stdioQueue.then(
+      (): Promise<ProbeOutcome> | ProbeOutcome =>
+        index > firstFailure ? { ok: false, error: new Error('Probe skipped.') } : run()
+    );
+    stdioQueue = outcome;
+    return outcome;
+  });
+};
+
 export const mcpDoctorHandler = async (
   parsed: ParsedMcpDoctor,
   streams: CliStreams
@@ -117,38 +155,32 @@ export const mcpDoctorHandler = async (
       status: string;
       error?: string;
     }> = [];
-    for (const server of targets) {
-      try {
-        const summary = await probeServer(server);
-        for (const item of summary) {
-          aggregated.push({
-            serverId: item.server.id,
-            transport: item.transport.label,
-            status: item.status,
-            error: item.error
-          });
-        }
-      } catch (error) {
-        const message =
-          error instanceof Error ? error.message : typeof error === 'string' ? error : 'Unknown error';
-        writeLine(streams.stderr, message);
+    for (const pending of startProbes(targets)) {
+      const outcome = await pending;
+      if (!outcome.ok) {
+        writeLine(streams.stderr, describeError(outcome.error));
         return 1;
       }
+      for (const item of outcome.value) {
+        aggregated.push({
+          serverId: item.server.id,
+          transport: item.transport.label,
+          status: item.status,
+          error: item.error
+        });
+      }
     }
     streams.stdout.write(`${JSON.stringify(aggregated, null, 2)}\n`);
     return 0;
   }
 
-  for (const server of targets) {
-    try {
-      const summary = await probeServer(server);
-      summarizeProbe(streams, { json: false }, summary);
-    } catch (error) {
-      const message =
-        error instanceof Error ? error.message : typeof error === 'string' ? error : 'Unknown error';
-      writeLine(streams.stderr, message);
+  for (const pending of startProbes(targets)) {
+    const outcome = await pending;
+    if (!outcome.ok) {
+      writeLine(streams.stderr, describeError(outcome.error));
       return 1;
     }
+    summarizeProbe(streams, { json: false }, outcome.value);
   }
 
   return 0;
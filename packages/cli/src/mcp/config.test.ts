@@ -29,4 +29,51 @@ describe('loadMcpServerDefinitions', () => {
       await rm(root, { recursive: true, force: true });
     }
   });
+
+  it('expands environment templates on every load', async () => {
+    const root = await mkdtemp(join(tmpdir(), 'mcp-config-'));
+    await writeFile(
+      join(root, 'templated.yaml'),
+      `type: mcp
+id: templated
+transport:
+  type: http
+  url: https://\${MAGSAG_CONFIG_TEST_HOST}/mcp
+`,
+      'utf8'
+    );
+    const previous = process.env.MAGSAG_CONFIG_TEST_HOST;
+
+    try {
+      process.env.MAGSAG_CONFIG_TEST_HOST = 'first.example.com';
+      const [first] = await loadMcpServerDefinitions(root);
+      expect(first?.transports[0]?.label).toBe('HTTP https://first.example.com/mcp');
+
+      process.env.MAGSAG_CONFIG_TEST_HOST = 'second.example.com';
+      const [second] = await loadMcpServerDefinitions(root);
+      expect(second?.transports[0]?.label).toBe('HTTP https://second.example.com/mcp');
+    } finally {
+      if (previous === undefined) {
+        delete process.env.MAGSAG_CONFIG_TEST_HOST;
+      } else {
+        process.env.MAGSAG_CONFIG_TEST_HOST = previous;
+      }
+      await rm(root, { recursive: true, force: true });
+    }
+  });
+
+  it('reports the first malformed preset in directory order', async () => {
+    const root = await mkdtemp(join(tmpdir(), 'mcp-config-'));
+    await writeFile(join(root, 'a-broken.yaml'), '- not\n- an\n- object\n', 'utf8');
+    await writeFile(join(root, 'b-broken.yaml'), 'type: mcp\nid: missing-transport\n', 'utf8');
+    await writeFile(join(root, 'c-valid.yaml'), createPresetYaml('valid'), 'utf8');
+
+    try {
+      const failure = loadMcpServerDefinitions(root);
+      await expect(failure).rejects.toThrow(/a-broken\.yaml/);
+      await expect(failure).rejects.not.toThrow(/b-broken\.yaml/);
+    } finally {
+      await rm(root, { recursive: true, force: true });
+    }
+  });
 });
@@ -310,19 +310,23 @@ const loadFromDirectory = async (directory: string): Promise<McpServerDefinition
     throw error;
   }
 
+  const presetFiles = entries
+    .filter((entry) => entry.isFile())
+    .filter((entry) => entry.name.endsWith('.yaml') || entry.name.endsWith('.yml'))
+    .map((entry) => join(absoluteDir, entry.name));
+
+  // Parse concurrently, but surface the first failure in directory order so the
+  // reported preset does not depend on which read finishes first.
+  const settled = await Promise.allSettled(
+    presetFiles.map((filePath) => parseServerFile(filePath))
+  );
   const definitions: McpServerDefinition[] = [];
-
-  for (const entry of entries) {
-    if (!entry.isFile()) {
-      continue;
-    }
-    if (!entry.name.endsWith('.yaml') && !entry.name.endsWith('.yml')) {
-      continue;
+  for (const result of settled) {
+    if (result.status === 'rejected') {
+      throw result.reason;
     }
-    const filePath = join(absoluteDir, entry.name);
-    const definition = await parseServerFile(filePath);
-    if (definition) {
-      definitions.push(definition);
+    if (result.value) {
+      definitions.push(result.value);
     }
   }
 